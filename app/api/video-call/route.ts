@@ -3,35 +3,32 @@ import { NextResponse } from "next/server"
 // In a real app, this would connect to a WebRTC signaling server
 // For demo purposes, we'll simulate the connection
 
+// In a real app, offers would be stored and the target user notified,
+// answers forwarded to the caller, and ICE candidates relayed to the peer
+const SIGNAL_MESSAGES = new Map<string, string>([
+  ["offer", "Offer sent successfully"],
+  ["answer", "Answer sent successfully"],
+  ["ice-candidate", "ICE candidate sent successfully"],
+])
+
 export async function POST(request: Request) {
   try {
     const { userId, targetId, type } = await request.json()
 
+    // Reject unknown signal types up front instead of after the simulated round-trip
+    const message = SIGNAL_MESSAGES.get(type)
+    if (!message) {
+      return NextResponse.json({ success: false, message: "Invalid request type" }, { status: 400 })
+    }
+
     // Simulate processing time
     await new Promise((resolve) => setTimeout(resolve, 1000))
 
-    if (type === "offer") {
-      // In a real app, this would store the offer and notify the target user
-      return NextResponse.json({
-        success: true,
-        message: "Offer sent successfully",
-        sessionId: `call-${Date.now()}`,
-      })
-    } else if (type === "answer") {
-      // In a real app, this would forward the answer to the caller
-      return NextResponse.json({
-        success: true,
-        message: "Answer sent successfully",
-      })
-    } else if (type === "ice-candidate") {
-      // In a real app, this would forward ICE candidates
-      return NextResponse.json({
-        success: true,
-        message: "ICE candidate sent successfully",
-      })
-    } else {
-      return NextResponse.json({ success: false, message: "Invalid request type" }, { status: 400 })
-    }
+    return NextResponse.json({
+      success: true,
+      message,
+      ...(type === "offer" ? { sessionId: `call-${Date.now()}` } : {}),
+    })
   } catch (error) {
     console.error("Error in video call API:", error)
     return NextResponse.json({ success: false, message: "Internal server error" }, { status: 500 })
@@ -120,6 +120,10 @@ export default function ScheduleAppointmentPage() {
     return therapists.find((t) => t.id === id)
   }
 
+  // Start of today, computed once per render and shared by every calendar day check
+  const startOfToday = new Date()
+  startOfToday.setHours(0, 0, 0, 0)
+
   return (
     <div className="container mx-auto px-4 py-8">
       <h1 className="text-3xl font-bold mb-6 text-blue-600">Schedule Appointment</h1>
@@ -238,9 +242,7 @@ export default function ScheduleAppointmentPage() {
                       className="rounded-md border"
                       disabled={(date) => {
                         // Disable past dates and Sundays
-                        const today = new Date()
-                        today.setHours(0, 0, 0, 0)
-                        return date < today || date.getDay() === 0
+                        return date < startOfToday || date.getDay() === 0
                       }}
                       initialFocus
                     />
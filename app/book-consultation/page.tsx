@@ -80,6 +80,10 @@ export default function BookConsultation() {
       </div>
     )
   }
+
+  // Computed once per render and shared by every calendar day check
+  const now = new Date()
+
   return (
     <div className="flex min-h-screen flex-col">
       <SiteHeader />
@@ -186,7 +190,7 @@ export default function BookConsultation() {
                             mode="single" 
                             selected={selectedDate}
                             onSelect={setSelectedDate}
-                            disabled={(date) => date < new Date()}
+                            disabled={(date) => date < now}
                             initialFocus 
                           />
                         </PopoverContent>
@@ -1,58 +1,61 @@
 "use client"
 
-import { useEffect, useState } from "react"
+import { useEffect, useMemo, useState } from "react"
 import Image from "next/image"
 import Link from "next/link"
+import { notFound } from "next/navigation"
 import { ArrowLeft, Search, Play, CheckCircle, Clock } from "lucide-react"
 import { Button } from "@/components/ui/button"
 import { Badge } from "@/components/ui/badge"
 import { Input } from "@/components/ui/input"
 import { DashboardLayout } from "@/components/dashboard-layout"
-import { exerciseCategories, getExercisesByCategory, type Exercise } from "@/lib/exercise-data"
+import { getCategoryById, getExercisesByCategory } from "@/lib/exercise-data"
 
 export default function ExerciseCategoryPage({ params }: { params: { category: string } }) {
   const [searchQuery, setSearchQuery] = useState("")
-  const [exercises, setExercises] = useState<Exercise[]>([])
-  const [filteredExercises, setFilteredExercises] = useState<Exercise[]>([])
-  const [category, setCategory] = useState<any>(null)
+  const [completedById, setCompletedById] = useState<Record<string, boolean>>({})
+  // Static catalogue lookups, resolved synchronously so an unknown slug can 404
+  const category = getCategoryById(params.category)
+  const exercises = getExercisesByCategory(params.category)
 
-  useEffect(() => {
-    const categoryData = exerciseCategories.find((c) => c.id === params.category)
-    setCategory(categoryData)
-
-    const exercisesData = getExercisesByCategory(params.category)
-    setExercises(exercisesData)
-    setFilteredExercises(exercisesData)
-  }, [params.category])
-
-  useEffect(() => {
+  const filteredExercises = useMemo(() => {
     if (searchQuery.trim() === "") {
-      setFilteredExercises(exercises)
-    } else {
-      const filtered = exercises.filter(
-        (exercise) =>
-          exercise.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          exercise.description.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          exercise.targetAreas.some((area) => area.toLowerCase().includes(searchQuery.toLowerCase())),
-      )
-      setFilteredExercises(filtered)
+      return exercises
     }
+
+    const lowercaseQuery = searchQuery.toLowerCase()
+    return exercises.filter(
+      (exercise) =>
+        exercise.name.toLowerCase().includes(lowercaseQuery) ||
+        exercise.description.toLowerCase().includes(lowercaseQuery) ||
+        exercise.targetAreas.some((area) => area.toLowerCase().includes(lowercaseQuery)),
+    )
   }, [searchQuery, exercises])
 
+  // Randomly assign completed status to exercises for demo purposes.
+  // Rolled after mount so server and client render the same markup, and once
+  // per category so searching or re-rendering doesn't reshuffle it.
+  useEffect(() => {
+    const status: Record<string, boolean> = {}
+    exercises.forEach((exercise) => {
+      status[exercise.id] = Math.random() > 0.7
+    })
+    setCompletedById(status)
+  }, [exercises])
+
+  const exercisesWithStatus = useMemo(
+    () =>
+      filteredExercises.map((exercise) => ({
+        ...exercise,
+        completed: completedById[exercise.id] ?? false,
+      })),
+    [filteredExercises, completedById],
+  )
+
   if (!category) {
-    return (
-      <DashboardLayout activeLink="exercises">
-        <div className="p-8">Loading...</div>
-      </DashboardLayout>
-    )
+    notFound()
   }
 
-  // Randomly assign completed status to exercises for demo purposes
-  const exercisesWithStatus = filteredExercises.map((exercise) => ({
-    ...exercise,
-    completed: Math.random() > 0.7,
-  }))
-
   return (
     <DashboardLayout activeLink="exercises">
       <div className="p-8">
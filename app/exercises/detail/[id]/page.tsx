@@ -3,24 +3,21 @@
 import { useEffect, useState } from "react"
 import Image from "next/image"
 import Link from "next/link"
+import { notFound } from "next/navigation"
 import { Play, Timer, CheckCircle, ChevronRight, Activity } from "lucide-react"
 import { Button } from "@/components/ui/button"
 import { DashboardLayout } from "@/components/dashboard-layout"
-import { getExerciseById, type Exercise } from "@/lib/exercise-data"
+import { getExerciseById } from "@/lib/exercise-data"
 
 export default function ExerciseDetailPage({ params }: { params: { id: string } }) {
-  const [exercise, setExercise] = useState<Exercise | null>(null)
+  // Static catalogue lookup, resolved synchronously so an unknown id can 404
+  const exercise = getExerciseById(params.id)
   const [currentSet, setCurrentSet] = useState(1)
   const [currentRep, setCurrentRep] = useState(0)
   const [isTimerRunning, setIsTimerRunning] = useState(false)
   const [time, setTime] = useState(0)
   const [isSetStarted, setIsSetStarted] = useState(false)
 
-  useEffect(() => {
-    const exerciseData = getExerciseById(params.id)
-    setExercise(exerciseData || null)
-  }, [params.id])
-
   // Timer effect
   useEffect(() => {
     let interval: NodeJS.Timeout | null = null
@@ -70,11 +67,7 @@ export default function ExerciseDetailPage({ params }: { params: { id: string }
   }
 
   if (!exercise) {
-    return (
-      <DashboardLayout activeLink="exercises">
-        <div className="p-8">Loading...</div>
-      </DashboardLayout>
-    )
+    notFound()
   }
 
   return (
@@ -87,14 +87,12 @@ export default function ConversationPage() {
   }
 
   // Format date for message groups
-  const formatDate = (date: Date) => {
-    const today = new Date()
-    const yesterday = new Date(today)
-    yesterday.setDate(yesterday.getDate() - 1)
+  const formatDate = (date: Date, todayString: string, yesterdayString: string) => {
+    const dateString = date.toDateString()
 
-    if (date.toDateString() === today.toDateString()) {
+    if (dateString === todayString) {
       return "Today"
-    } else if (date.toDateString() === yesterday.toDateString()) {
+    } else if (dateString === yesterdayString) {
       return "Yesterday"
     } else {
       return date.toLocaleDateString()
@@ -107,8 +105,15 @@ export default function ConversationPage() {
     let currentDate = ""
     let currentGroup: typeof conversation.messages = []
 
+    // Resolve "today" and "yesterday" once for the whole conversation, not per message
+    const today = new Date()
+    const yesterday = new Date(today)
+    yesterday.setDate(yesterday.getDate() - 1)
+    const todayString = today.toDateString()
+    const yesterdayString = yesterday.toDateString()
+
     conversation.messages.forEach((message) => {
-      const messageDate = formatDate(message.timestamp)
+      const messageDate = formatDate(message.timestamp, todayString, yesterdayString)
 
       if (messageDate !== currentDate) {
         if (currentGroup.length > 0) {
@@ -162,19 +167,22 @@ export default function ConversationPage() {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" })
   }, [conversation.messages])
 
-  // Join room on component mount
+  // Join the room for as long as this conversation is open. The socket provider
+  // replays membership on reconnect, so connection changes must not leave the room.
   useEffect(() => {
-    if (isConnected) {
-      joinRoom(params.id as string)
-      setIsLoading(false)
-    }
+    const roomId = params.id as string
+    joinRoom(roomId)
 
     return () => {
-      if (isConnected) {
-        leaveRoom(params.id as string)
-      }
+      leaveRoom(roomId)
+    }
+  }, [joinRoom, leaveRoom, params.id])
+
+  useEffect(() => {
+    if (isConnected) {
+      setIsLoading(false)
     }
-  }, [isConnected, joinRoom, leaveRoom, params.id])
+  }, [isConnected])
 
   if (isLoading) {
     return <div className="flex items-center justify-center h-screen">Loading conversation...</div>
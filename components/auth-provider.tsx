@@ -111,9 +111,10 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
       if (foundUser) {
         // Use existing user data
         const { password: _, ...userWithoutPassword } = foundUser
+        const serializedUser = JSON.stringify(userWithoutPassword)
         setUser(userWithoutPassword)
-        localStorage.setItem("kineticUser", JSON.stringify(userWithoutPassword))
-        document.cookie = `kineticUser=${JSON.stringify(userWithoutPassword)}; path=/; max-age=86400`
+        localStorage.setItem("kineticUser", serializedUser)
+        document.cookie = `kineticUser=${serializedUser}; path=/; max-age=86400`
         return { success: true }
       }
       
@@ -140,9 +141,10 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
           avatar: isProvider ? '/caring-doctor.png' : '/smiling-brown-haired-woman.png'
         }
         
+        const serializedUser = JSON.stringify(newUser)
         setUser(newUser)
-        localStorage.setItem("kineticUser", JSON.stringify(newUser))
-        document.cookie = `kineticUser=${JSON.stringify(newUser)}; path=/; max-age=86400`
+        localStorage.setItem("kineticUser", serializedUser)
+        document.cookie = `kineticUser=${serializedUser}; path=/; max-age=86400`
         
         return { success: true }
       }
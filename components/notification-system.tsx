@@ -1,6 +1,6 @@
 "use client"
 
-import { useState, useEffect } from "react"
+import { useState, useEffect, useMemo, useRef } from "react"
 import { motion, AnimatePresence } from "framer-motion"
 import { Bell, X, MessageSquare, Calendar, Activity, CheckCircle } from "lucide-react"
 import { useSocket } from "@/lib/socket-provider"
@@ -14,68 +14,76 @@ export type Notification = {
   timestamp: Date
 }
 
-export function NotificationSystem() {
-  const [notifications, setNotifications] = useState<Notification[]>([])
-  const [showNotifications, setShowNotifications] = useState(false)
-  const [newNotification, setNewNotification] = useState<Notification | null>(null)
-  const { socket, isConnected } = useSocket()
+// Monotonic counter so notification ids never collide, even within the same millisecond
+let nextNotificationId = 0
+
+// Notification templates, built once per module rather than on every generated notification
+const NOTIFICATION_TYPES: Notification["type"][] = ["message", "appointment", "exercise", "progress"];
 
-  // Generate random notifications
-  const generateRandomNotification = (): Notification => {
-    const types: Notification["type"][] = ["message", "appointment", "exercise", "progress"];
-    const type = types[Math.floor(Math.random() * types.length)];
+const NOTIFICATION_TITLES: Record<Notification["type"], string[]> = {
+  message: ["New Message", "Message Received", "Therapist Message"],
+  appointment: ["Appointment Reminder", "Appointment Update", "Schedule Change"],
+  exercise: ["Exercise Completed", "New Exercise Added", "Exercise Reminder"],
+  progress: ["Progress Update", "Recovery Milestone", "Goal Achieved"]
+};
 
-    const titles = {
-      message: ["New Message", "Message Received", "Therapist Message"],
-      appointment: ["Appointment Reminder", "Appointment Update", "Schedule Change"],
-      exercise: ["Exercise Completed", "New Exercise Added", "Exercise Reminder"],
-      progress: ["Progress Update", "Recovery Milestone", "Goal Achieved"]
-    };
+const NOTIFICATION_MESSAGES: Record<Notification["type"], string[]> = {
+  message: [
+    "Dr. Sarah Johnson sent you a message",
+    "Dr. Michael Chen has a question about your progress",
+    "New message from your physical therapist",
+    "Reception sent you information about your next visit"
+  ],
+  appointment: [
+    "You have an appointment tomorrow at 2:30 PM",
+    "Your appointment on Friday has been confirmed",
+    "Reminder: Video consultation in 2 hours",
+    "Your therapist suggested a follow-up appointment"
+  ],
+  exercise: [
+    "Great job! You've completed today's exercises",
+    "New exercise routine has been added to your program",
+    "Don't forget to complete your evening exercises",
+    "Your exercise performance has improved by 15%"
+  ],
+  progress: [
+    "Your therapist has updated your recovery progress",
+    "Congratulations! You've reached a recovery milestone",
+    "Your range of motion has improved significantly",
+    "Weekly progress report is now available"
+  ]
+};
 
-    const messages = {
-      message: [
-        "Dr. Sarah Johnson sent you a message",
-        "Dr. Michael Chen has a question about your progress",
-        "New message from your physical therapist",
-        "Reception sent you information about your next visit"
-      ],
-      appointment: [
-        "You have an appointment tomorrow at 2:30 PM",
-        "Your appointment on Friday has been confirmed",
-        "Reminder: Video consultation in 2 hours",
-        "Your therapist suggested a follow-up appointment"
-      ],
-      exercise: [
-        "Great job! You've completed today's exercises",
-        "New exercise routine has been added to your program",
-        "Don't forget to complete your evening exercises",
-        "Your exercise performance has improved by 15%"
-      ],
-      progress: [
-        "Your therapist has updated your recovery progress",
-        "Congratulations! You've reached a recovery milestone",
-        "Your range of motion has improved significantly",
-        "Weekly progress report is now available"
-      ]
-    };
+// Generate random notifications
+const generateRandomNotification = (): Notification => {
+  const type = NOTIFICATION_TYPES[Math.floor(Math.random() * NOTIFICATION_TYPES.length)];
 
-    const title = titles[type][Math.floor(Math.random() * titles[type].length)];
-    const message = messages[type][Math.floor(Math.random() * messages[type].length)];
+  const titles = NOTIFICATION_TITLES[type];
+  const messages = NOTIFICATION_MESSAGES[type];
+  const title = titles[Math.floor(Math.random() * titles.length)];
+  const message = messages[Math.floor(Math.random() * messages.length)];
 
-    // Generate a random timestamp within the last 24 hours
-    const hoursAgo = Math.floor(Math.random() * 24);
-    const minutesAgo = Math.floor(Math.random() * 60);
-    const timestamp = new Date(Date.now() - (hoursAgo * 60 * 60 * 1000) - (minutesAgo * 60 * 1000));
+  // Generate a random timestamp within the last 24 hours
+  const hoursAgo = Math.floor(Math.random() * 24);
+  const minutesAgo = Math.floor(Math.random() * 60);
+  const timestamp = new Date(Date.now() - (hoursAgo * 60 * 60 * 1000) - (minutesAgo * 60 * 1000));
 
-    return {
-      id: Date.now().toString() + Math.random().toString(36).substr(2, 5),
-      title,
-      message,
-      type,
-      read: Math.random() > 0.7, // 30% chance of being unread
-      timestamp
-    };
+  return {
+    id: `notification-${nextNotificationId++}`,
+    title,
+    message,
+    type,
+    read: Math.random() > 0.7, // 30% chance of being unread
+    timestamp
   };
+};
+
+export function NotificationSystem() {
+  const [notifications, setNotifications] = useState<Notification[]>([])
+  const [showNotifications, setShowNotifications] = useState(false)
+  const [newNotification, setNewNotification] = useState<Notification | null>(null)
+  const { socket, isConnected } = useSocket()
+  const hideToastTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null)
 
   // Simulate receiving notifications
   useEffect(() => {
@@ -104,14 +112,24 @@ export function NotificationSystem() {
           setNotifications((prev) => [newNotif, ...prev]);
           setNewNotification(newNotif);
 
-          // Auto-hide the notification after 5 seconds
-          setTimeout(() => {
+          // Auto-hide the notification after 5 seconds; only the latest toast's timer stays armed
+          if (hideToastTimerRef.current) {
+            clearTimeout(hideToastTimerRef.current);
+          }
+          hideToastTimerRef.current = setTimeout(() => {
+            hideToastTimerRef.current = null;
             setNewNotification(null);
           }, 5000);
         }
       }, 15000); // Check every 15 seconds
 
-      return () => clearInterval(interval);
+      return () => {
+        clearInterval(interval);
+        if (hideToastTimerRef.current) {
+          clearTimeout(hideToastTimerRef.current);
+          hideToastTimerRef.current = null;
+        }
+      };
     }
   }, [isConnected])
 
@@ -154,9 +172,8 @@ export function NotificationSystem() {
     }
   }
 
-  const formatTime = (date: Date) => {
-    const now = new Date()
-    const diffMs = now.getTime() - date.getTime()
+  const formatTime = (date: Date, now: number) => {
+    const diffMs = now - date.getTime()
     const diffMins = Math.floor(diffMs / (1000 * 60))
     const diffHours = Math.floor(diffMs / (1000 * 60 * 60))
     const diffDays = Math.floor(diffMs / (1000 * 60 * 60 * 24))
@@ -167,7 +184,11 @@ export function NotificationSystem() {
     return `${diffDays}d ago`
   }
 
-  const unreadCount = notifications.filter((n) => !n.read).length
+  // Only recount when the list changes, not on every panel toggle or toast update
+  const unreadCount = useMemo(() => notifications.filter((n) => !n.read).length, [notifications])
+
+  // Read the clock once per render rather than once per listed notification
+  const now = Date.now()
 
   return (
     <>
@@ -228,7 +249,7 @@ export function NotificationSystem() {
                             </button>
                           </div>
                           <p className="text-sm text-gray-600 mt-1">{notification.message}</p>
-                          <p className="text-xs text-gray-500 mt-1">{formatTime(notification.timestamp)}</p>
+                          <p className="text-xs text-gray-500 mt-1">{formatTime(notification.timestamp, now)}</p>
                         </div>
                       </div>
                     </div>
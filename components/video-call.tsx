@@ -27,6 +27,9 @@ export function VideoCall({
   const [isConnecting, setIsConnecting] = useState(true)
   const localVideoRef = useRef<HTMLVideoElement>(null)
   const remoteVideoRef = useRef<HTMLVideoElement>(null)
+  const cameraStreamRef = useRef<MediaStream | null>(null)
+  const screenStreamRef = useRef<MediaStream | null>(null)
+  const isMountedRef = useRef(true)
 
   // Simulate connecting and then showing the video
   useEffect(() => {
@@ -37,6 +40,16 @@ export function VideoCall({
     return () => clearTimeout(timer)
   }, [])
 
+  // Release the camera and any screen capture when the call closes
+  useEffect(() => {
+    isMountedRef.current = true
+    return () => {
+      isMountedRef.current = false
+      cameraStreamRef.current?.getTracks().forEach((track) => track.stop())
+      screenStreamRef.current?.getTracks().forEach((track) => track.stop())
+    }
+  }, [])
+
   // Update call duration
   useEffect(() => {
     if (!isConnecting) {
@@ -58,7 +71,31 @@ export function VideoCall({
   const startLocalVideo = async () => {
     try {
       if (localVideoRef.current) {
-        const stream = await navigator.mediaDevices.getUserMedia({ video: true, audio: true })
+        // Reuse the camera stream we already hold instead of re-acquiring it
+        // (e.g. when returning from screen sharing), unless its tracks have ended
+        // because the device was unplugged or permission was revoked
+        let stream = cameraStreamRef.current
+        if (!stream || stream.getTracks().every((track) => track.readyState === "ended")) {
+          stream = await navigator.mediaDevices.getUserMedia({ video: true, audio: true })
+
+          // The call may have closed while we waited for the camera
+          if (!isMountedRef.current) {
+            stream.getTracks().forEach((track) => track.stop())
+            return
+          }
+
+          cameraStreamRef.current = stream
+        }
+
+        // Apply the current mute / video-off state to whichever stream we ended up with,
+        // cached or fresh
+        stream.getAudioTracks().forEach((track) => {
+          track.enabled = !isMuted
+        })
+        stream.getVideoTracks().forEach((track) => {
+          track.enabled = !isVideoOff
+        })
+        if (!localVideoRef.current) return
         localVideoRef.current.srcObject = stream
 
         // Simulate remote video (therapist) with a delayed connection
@@ -77,34 +114,40 @@ export function VideoCall({
     }
   }
 
+  // Act on the camera stream itself rather than srcObject, which holds the screen
+  // capture while sharing
   const toggleMute = () => {
     setIsMuted(!isMuted)
-    if (localVideoRef.current && localVideoRef.current.srcObject) {
-      const stream = localVideoRef.current.srcObject as MediaStream
-      stream.getAudioTracks().forEach((track) => {
-        track.enabled = isMuted
-      })
-    }
+    cameraStreamRef.current?.getAudioTracks().forEach((track) => {
+      track.enabled = isMuted
+    })
   }
 
   const toggleVideo = () => {
     setIsVideoOff(!isVideoOff)
-    if (localVideoRef.current && localVideoRef.current.srcObject) {
-      const stream = localVideoRef.current.srcObject as MediaStream
-      stream.getVideoTracks().forEach((track) => {
-        track.enabled = isVideoOff
-      })
-    }
+    cameraStreamRef.current?.getVideoTracks().forEach((track) => {
+      track.enabled = isVideoOff
+    })
   }
 
   const toggleScreenShare = async () => {
     try {
       if (isScreenSharing) {
-        // Return to camera
+        // Return to camera, releasing the screen capture
+        screenStreamRef.current?.getTracks().forEach((track) => track.stop())
+        screenStreamRef.current = null
         startLocalVideo()
       } else {
         // Share screen
         const stream = await navigator.mediaDevices.getDisplayMedia({ video: true })
+
+        // The call may have closed while the share picker was open
+        if (!isMountedRef.current) {
+          stream.getTracks().forEach((track) => track.stop())
+          return
+        }
+
+        screenStreamRef.current = stream
         if (localVideoRef.current) {
           localVideoRef.current.srcObject = stream
         }
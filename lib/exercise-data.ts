@@ -543,14 +543,26 @@ export const exercises: Record<string, Exercise[]> = {
   ]
 }
 
+// Flattened once at load time; the catalogue is static and shared, so it is frozen
+const allExercises: readonly Exercise[] = Object.freeze(Object.values(exercises).flat())
+
 // Function to get all exercises
-export function getAllExercises(): Exercise[] {
-  return Object.values(exercises).flat()
+export function getAllExercises(): readonly Exercise[] {
+  return allExercises
 }
 
+// Id indexes for constant-time lookups
+const exercisesById = new Map(allExercises.map((exercise) => [exercise.id, exercise]))
+const categoriesById = new Map(exerciseCategories.map((category) => [category.id, category]))
+
 // Function to get exercise by ID
 export function getExerciseById(id: string): Exercise | undefined {
-  return getAllExercises().find((exercise) => exercise.id === id)
+  return exercisesById.get(id)
+}
+
+// Function to get category by ID
+export function getCategoryById(id: string): ExerciseCategory | undefined {
+  return categoriesById.get(id)
 }
 
 // Function to get exercises by category
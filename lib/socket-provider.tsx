@@ -1,9 +1,21 @@
 "use client"
 
 import type React from "react"
-import { createContext, useContext, useEffect, useState } from "react"
+import { createContext, useCallback, useContext, useEffect, useRef, useState } from "react"
 import { io, type Socket } from "socket.io-client"
 
+// Upper bound on messages held while the socket is offline
+const MAX_OUTBOX_SIZE = 256
+
+type OutboundMessage = { event: string; payload: any }
+
+// Per-event logging is only useful while developing; skip it entirely in production builds
+const debugLog = (...args: any[]) => {
+  if (process.env.NODE_ENV !== "production") {
+    console.log(...args)
+  }
+}
+
 type SocketContextType = {
   socket: Socket | null
   isConnected: boolean
@@ -33,6 +45,11 @@ export const SocketProvider = ({ children }: { children: React.ReactNode }) => {
   const [isConnected, setIsConnected] = useState(false)
   const [lastMessage, setLastMessage] = useState<any>(null)
   const [typingStatus, setTypingStatus] = useState<Record<string, { userId: string; username: string }>>({})
+  const outboxRef = useRef<OutboundMessage[]>([])
+  // Rooms this client has joined, re-joined on every (re)connect before the outbox is flushed
+  const joinedRoomsRef = useRef<Set<string>>(new Set())
+  // Live socket for the stable room callbacks below, which must not change identity
+  const socketRef = useRef<Socket | null>(null)
 
   useEffect(() => {
     // In a real app, this would connect to your actual WebSocket server
@@ -44,28 +61,40 @@ export const SocketProvider = ({ children }: { children: React.ReactNode }) => {
     })
 
     socketInstance.on("connect", () => {
-      console.log("Socket connected")
+      debugLog("Socket connected")
       setIsConnected(true)
+
+      // Restore room membership first so queued messages land in the right rooms
+      joinedRoomsRef.current.forEach((roomId) => socketInstance.emit("join_room", roomId))
+
+      // Deliver anything queued while we were offline
+      const pending = outboxRef.current
+      outboxRef.current = []
+      pending.forEach(({ event, payload }) => socketInstance.emit(event, payload))
     })
 
     socketInstance.on("disconnect", () => {
-      console.log("Socket disconnected")
+      debugLog("Socket disconnected")
       setIsConnected(false)
     })
 
     socketInstance.on("message", (message) => {
-      console.log("New message received", message)
+      debugLog("New message received", message)
       setLastMessage(message)
     })
 
-    socketInstance.on("typing", ({ roomId, user }) => {
-      setTypingStatus((prev) => ({
-        ...prev,
-        [roomId]: user,
-      }))
+    // One pending clear per room, so a stream of typing events can't pile up timers
+    const typingTimers = new Map<string, ReturnType<typeof setTimeout>>()
 
-      // Clear typing indicator after 3 seconds of inactivity
-      setTimeout(() => {
+    // Clear typing indicator after 3 seconds of inactivity
+    const scheduleTypingClear = (roomId: string, user: { userId: string; username: string }) => {
+      const pending = typingTimers.get(roomId)
+      if (pending) {
+        clearTimeout(pending)
+      }
+
+      const timer = setTimeout(() => {
+        typingTimers.delete(roomId)
         setTypingStatus((prev) => {
           const newStatus = { ...prev }
           if (newStatus[roomId]?.userId === user.userId) {
@@ -74,41 +103,75 @@ export const SocketProvider = ({ children }: { children: React.ReactNode }) => {
           return newStatus
         })
       }, 3000)
+      typingTimers.set(roomId, timer)
+    }
+
+    socketInstance.on("typing", ({ roomId, user }) => {
+      setTypingStatus((prev) => ({
+        ...prev,
+        [roomId]: user,
+      }))
+      scheduleTypingClear(roomId, user)
     })
 
     socketInstance.on("appointment_update", (data) => {
-      console.log("Appointment update received", data)
+      debugLog("Appointment update received", data)
       // In a real app, you would update your appointment state here
       // For example, dispatch an action to update the Redux store
     })
 
+    socketRef.current = socketInstance
     setSocket(socketInstance)
 
     return () => {
+      socketRef.current = null
+      typingTimers.forEach((timer) => clearTimeout(timer))
+      typingTimers.clear()
       socketInstance.disconnect()
     }
   }, [])
 
-  const sendMessage = (roomId: string, message: any) => {
-    if (socket && isConnected) {
-      socket.emit("message", { roomId, message })
+  const enqueue = (event: string, payload: any) => {
+    if (socket && socket.connected) {
+      socket.emit(event, payload)
+      return
     }
-  }
 
-  const joinRoom = (roomId: string) => {
-    if (socket && isConnected) {
-      socket.emit("join_room", roomId)
+    // Queue while offline, dropping the oldest entry once the outbox is full
+    const outbox = outboxRef.current
+    if (outbox.length >= MAX_OUTBOX_SIZE) {
+      console.warn("Socket outbox full, dropping oldest message")
+      outbox.shift()
     }
+    outbox.push({ event, payload })
   }
 
-  const leaveRoom = (roomId: string) => {
-    if (socket && isConnected) {
-      socket.emit("leave_room", roomId)
-    }
+  const sendMessage = (roomId: string, message: any) => {
+    enqueue("message", { roomId, message })
   }
 
+  // Membership is tracked locally and replayed on connect, so joins/leaves made while
+  // offline take effect on reconnect instead of being dropped. Both callbacks are stable
+  // so consumers can key their join/leave effects on the room id alone.
+  const joinRoom = useCallback((roomId: string) => {
+    joinedRoomsRef.current.add(roomId)
+    const current = socketRef.current
+    if (current && current.connected) {
+      current.emit("join_room", roomId)
+    }
+  }, [])
+
+  const leaveRoom = useCallback((roomId: string) => {
+    joinedRoomsRef.current.delete(roomId)
+    const current = socketRef.current
+    if (current && current.connected) {
+      current.emit("leave_room", roomId)
+    }
+  }, [])
+
+  // Typing indicators are ephemeral, so they are not queued while offline
   const setTyping = (roomId: string, isTyping: boolean) => {
-    if (socket && isConnected && isTyping) {
+    if (socket && socket.connected && isTyping) {
       // In a real app, you would get the user info from your auth context
       const user = {
         userId: "current-user-id",